@@ -169,7 +169,12 @@ class LowerCompoundAlgebra(MultiFunction):
         error("Invalid shape %s of curl argument." % (sh,))
 
 
+# LowerCompoundAlgebra is stateless, so one instance can serve all
+# calls; constructing a MultiFunction sets up its handler table
+_lowerer = LowerCompoundAlgebra()
+
+
 def apply_algebra_lowering(expr):
     """Expands high level compound operators (e.g. inner) to equivalent
     representations using basic operators (e.g. index notation)."""
-    return map_integrand_dags(LowerCompoundAlgebra(), expr)
+    return map_integrand_dags(_lowerer, expr)
@@ -1052,6 +1052,17 @@ class DerivativeRuleDispatcher(MultiFunction):
         # caches for reuse in the dispatched transformers
         self.vcaches = defaultdict(dict)
         self.rcaches = defaultdict(dict)
+        # cache for the dispatched rulesets themselves; constructing a
+        # ruleset implies a MultiFunction handler table setup, which is
+        # wasted work when many nodes share the same ruleset key
+        self.rulesets = {}
+
+    def _get_ruleset(self, key, ruleset_class, *args):
+        rules = self.rulesets.get(key)
+        if rules is None:
+            rules = ruleset_class(*args)
+            self.rulesets[key] = rules
+        return rules
 
     def terminal(self, o):
         return o
@@ -1062,31 +1073,32 @@ class DerivativeRuleDispatcher(MultiFunction):
     expr = MultiFunction.reuse_if_untouched
 
     def grad(self, o, f):
-        rules = GradRuleset(o.ufl_shape[-1])
         key = (GradRuleset, o.ufl_shape[-1])
+        rules = self._get_ruleset(key, GradRuleset, o.ufl_shape[-1])
         return map_expr_dag(rules, f,
                             vcache=self.vcaches[key],
                             rcache=self.rcaches[key])
 
     def reference_grad(self, o, f):
-        rules = ReferenceGradRuleset(o.ufl_shape[-1])  # FIXME: Look over this and test better.
+        # FIXME: Look over this and test better.
         key = (ReferenceGradRuleset, o.ufl_shape[-1])
+        rules = self._get_ruleset(key, ReferenceGradRuleset, o.ufl_shape[-1])
         return map_expr_dag(rules, f,
                             vcache=self.vcaches[key],
                             rcache=self.rcaches[key])
 
     def variable_derivative(self, o, f, dummy_v):
         op = o.ufl_operands[1]
-        rules = VariableRuleset(op)
         key = (VariableRuleset, op)
+        rules = self._get_ruleset(key, VariableRuleset, op)
         return map_expr_dag(rules, f,
                             vcache=self.vcaches[key],
                             rcache=self.rcaches[key])
 
     def coefficient_derivative(self, o, f, dummy_w, dummy_v, dummy_cd):
         dummy, w, v, cd = o.ufl_operands
-        rules = GateauxDerivativeRuleset(w, v, cd)
         key = (GateauxDerivativeRuleset, w, v, cd)
+        rules = self._get_ruleset(key, GateauxDerivativeRuleset, w, v, cd)
         return map_expr_dag(rules, f,
                             vcache=self.vcaches[key],
                             rcache=self.rcaches[key])
@@ -1232,6 +1244,7 @@ class CoordinateDerivativeRuleDispatcher(MultiFunction):
         MultiFunction.__init__(self)
         self.vcache = defaultdict(dict)
         self.rcache = defaultdict(dict)
+        self.rulesets = {}
 
     def terminal(self, o):
         return o
@@ -1258,8 +1271,11 @@ class CoordinateDerivativeRuleDispatcher(MultiFunction):
             error("CoordinateDerivative is not supported for elements of type %s. "
                   "This is because their pullback is not implemented in UFL." % unsupported_spaces)
         _, w, v, cd = o.ufl_operands
-        rules = CoordinateDerivativeRuleset(w, v, cd)
         key = (CoordinateDerivativeRuleset, w, v, cd)
+        rules = self.rulesets.get(key)
+        if rules is None:
+            rules = CoordinateDerivativeRuleset(w, v, cd)
+            self.rulesets[key] = rules
         return map_expr_dag(rules, f, vcache=self.vcache[key], rcache=self.rcache[key])
 
 
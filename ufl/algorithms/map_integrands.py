@@ -43,5 +43,13 @@ def map_integrands(function, form, only_integral_type=None):
 
 
 def map_integrand_dags(function, form, only_integral_type=None, compress=True):
-    return map_integrands(lambda expr: map_expr_dag(function, expr, compress),
+    # Share transformation caches between the integrands of the form,
+    # so subexpressions recurring in several integrals (e.g. cell and
+    # facet terms of the same equation) are transformed only once.
+    # The caches live only for the duration of this call.
+    vcache = {}
+    rcache = {}
+    return map_integrands(lambda expr: map_expr_dag(function, expr, compress,
+                                                    vcache=vcache,
+                                                    rcache=rcache),
                           form, only_integral_type)
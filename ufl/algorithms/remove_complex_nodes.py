@@ -28,10 +28,15 @@ class ComplexNodeRemoval(MultiFunction):
             return t
 
 
+# ComplexNodeRemoval is stateless, so one instance can serve all
+# calls; constructing a MultiFunction sets up its handler table
+_remover = ComplexNodeRemoval()
+
+
 def remove_complex_nodes(expr):
     """Replaces complex operator nodes with their children. This is called
     during compute_form_data if the compiler wishes to compile
     real-valued forms. In essence this strips all trace of complex
     support from the preprocessed form.
     """
-    return map_integrand_dags(ComplexNodeRemoval(), expr)
+    return map_integrand_dags(_remover, expr)
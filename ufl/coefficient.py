@@ -12,6 +12,8 @@ of related classes, including Constant."""
 # Modified by Massimiliano Leoni, 2016.
 # Modified by Cecile Daversin-Catty, 2018.
 
+import itertools
+
 from ufl.log import error
 from ufl.core.ufl_type import ufl_type
 from ufl.core.terminal import FormArgument
@@ -19,7 +21,23 @@ from ufl.finiteelement import FiniteElementBase
 from ufl.domain import default_domain
 from ufl.functionspace import AbstractFunctionSpace, FunctionSpace, MixedFunctionSpace
 from ufl.split_functions import split
-from ufl.utils.counted import counted_init
+
+# Global counter for the count of new coefficients; itertools.count
+# increments atomically in C, unlike the class attribute read-modify-
+# write in counted_init.
+_coefficient_counter = itertools.count()
+
+
+def _next_count(count=None):
+    "Return count if given, otherwise draw from the global counter."
+    global _coefficient_counter
+    if count is None:
+        return next(_coefficient_counter)
+    # Keep automatically assigned counts ahead of any explicitly
+    # given count, like counted_init does with _globalcount
+    _coefficient_counter = itertools.count(
+        max(count + 1, next(_coefficient_counter)))
+    return count
 
 # --- The Coefficient class represents a coefficient in a form ---
 
@@ -28,15 +46,16 @@ from ufl.utils.counted import counted_init
 class Coefficient(FormArgument):
     """UFL form argument type: Representation of a form coefficient."""
 
-    # Slots are disabled here because they cause trouble in PyDOLFIN
-    # multiple inheritance pattern:
-    # __slots__ = ("_count", "_ufl_function_space", "_repr", "_ufl_shape")
-    _ufl_noslots_ = True
-    _globalcount = 0
+    # NB! Subclasses that need the PyDOLFIN multiple inheritance
+    # pattern must declare __slots__ = ("__dict__",) themselves;
+    # plain UFL coefficients stay dict-free to save memory.
+    __slots__ = ("_count", "_ufl_function_space", "_repr", "_ufl_shape",
+                 "_ufl_domain", "_ufl_element", "_ufl_domains",
+                 "_is_cellwise_constant", "_hash_key")
 
     def __init__(self, function_space, count=None):
         FormArgument.__init__(self)
-        counted_init(self, count, Coefficient)
+        self._count = _next_count(count)
 
         if isinstance(function_space, FiniteElementBase):
             # For legacy support for .ufl files using cells, we map
@@ -48,10 +67,28 @@ class Coefficient(FormArgument):
             error("Expecting a FunctionSpace or FiniteElement.")
 
         self._ufl_function_space = function_space
-        self._ufl_shape = function_space.ufl_element().value_shape()
 
-        self._repr = "Coefficient(%s, %s)" % (
-            repr(self._ufl_function_space), repr(self._count))
+        # Cache accessor values from the function space; they cannot
+        # change after construction, and going through the function
+        # space on every call costs two attribute lookups plus a
+        # method dispatch on the DAG traversal path.
+        self._ufl_element = function_space.ufl_element()
+        self._ufl_domain = function_space.ufl_domain()
+        self._ufl_domains = function_space.ufl_domains()
+        self._is_cellwise_constant = self._ufl_element.is_cellwise_constant()
+        self._ufl_shape = function_space.ufl_value_shape()
+
+        # The repr string is built lazily in __repr__; most
+        # coefficients are never repr'd and the string drags in
+        # repr of the whole function space.
+        self._repr = None
+
+        # Precompute a hash key from the count and the function space
+        # hash data, reducing __eq__ and __hash__ to comparisons of
+        # small immutable tuples. These are called for every node
+        # comparison in DAG traversal and renumbering dicts.
+        self._hash_key = (self._count, function_space._ufl_hash_data_())
+        self._hash = hash(self._hash_key)
 
     def count(self):
         return self._count
@@ -67,19 +104,19 @@ class Coefficient(FormArgument):
 
     def ufl_domain(self):
         "Shortcut to get the domain of the function space of this coefficient."
-        return self._ufl_function_space.ufl_domain()
+        return self._ufl_domain
 
     def ufl_element(self):
         "Shortcut to get the finite element of the function space of this coefficient."
-        return self._ufl_function_space.ufl_element()
+        return self._ufl_element
 
     def is_cellwise_constant(self):
         "Return whether this expression is spatially constant over each cell."
-        return self.ufl_element().is_cellwise_constant()
+        return self._is_cellwise_constant
 
     def ufl_domains(self):
         "Return tuple of domains related to this terminal object."
-        return self._ufl_function_space.ufl_domains()
+        return self._ufl_domains
 
     def _ufl_signature_data_(self, renumbering):
         "Signature data for form arguments depend on the global numbering of the form arguments and domains."
@@ -95,15 +132,25 @@ class Coefficient(FormArgument):
             return "w_{%s}" % count
 
     def __repr__(self):
+        if self._repr is None:
+            self._repr = "Coefficient(%s, %s)" % (
+                repr(self._ufl_function_space), repr(self._count))
         return self._repr
 
     def __eq__(self, other):
-        if not isinstance(other, Coefficient):
-            return False
         if self is other:
             return True
-        return (self._count == other._count and
-                self._ufl_function_space == other._ufl_function_space)
+        if not isinstance(other, Coefficient):
+            return False
+        if self._count != other._count:
+            # Distinct coefficients have distinct counts by
+            # construction, so this decides almost all comparisons
+            return False
+        fs = self._ufl_function_space
+        ofs = other._ufl_function_space
+        # Interned function spaces are usually decided by identity;
+        # fall back to value comparison for distinct but equal spaces
+        return fs is ofs or fs == ofs
 
 
 # --- Helper functions for subfunctions on mixed elements ---
@@ -112,7 +159,8 @@ def Coefficients(function_space):
     """UFL value: Create a Coefficient in a mixed space, and return a
     tuple with the function components corresponding to the subelements."""
     if isinstance(function_space, MixedFunctionSpace):
-        return [Coefficient(function_space.ufl_sub_space(i))
-                for i in range(function_space.num_sub_spaces())]
+        # Iterate over the sub spaces directly instead of indexing
+        # into the space once per subfield
+        return [Coefficient(fs) for fs in function_space.ufl_sub_spaces()]
     else:
         return split(Coefficient(function_space))
@@ -271,11 +271,13 @@ def as_domain(domain):
     if isinstance(domain, AbstractDomain):
         # Modern .ufl files and dolfin behaviour
         return domain
-    elif hasattr(domain, "ufl_domain"):
+
+    ufl_domain = getattr(domain, "ufl_domain", None)
+    if ufl_domain is not None:
         # If we get a dolfin.Mesh, it can provide us a corresponding
         # ufl.Mesh.  This would be unnecessary if dolfin.Mesh could
         # subclass ufl.Mesh.
-        return domain.ufl_domain()
+        return ufl_domain()
     else:
         # Legacy .ufl files
         # TODO: Make this conversion in the relevant constructors
@@ -358,12 +360,14 @@ def find_geometric_dimension(expr):
     "Find the geometric dimension of an expression."
     gdims = set()
     for t in traverse_unique_terminals(expr):
-        if hasattr(t, "ufl_domain"):
-            domain = t.ufl_domain()
+        ufl_domain = getattr(t, "ufl_domain", None)
+        if ufl_domain is not None:
+            domain = ufl_domain()
             if domain is not None:
                 gdims.add(domain.geometric_dimension())
-        if hasattr(t, "ufl_element"):
-            element = t.ufl_element()
+        ufl_element = getattr(t, "ufl_element", None)
+        if ufl_element is not None:
+            element = ufl_element()
             if element is not None:
                 cell = element.cell()
                 if cell is not None:
@@ -10,6 +10,8 @@
 # Modified by Massimiliano Leoni, 2016
 # Modified by Cecile Daversin-Catty, 2018
 
+import weakref
+
 from ufl.log import error
 from ufl.core.ufl_type import attach_operators_from_hash_data
 from ufl.domain import join_domains
@@ -24,13 +26,44 @@ __all_classes__ = [
 
 
 class AbstractFunctionSpace(object):
+    __slots__ = ("__weakref__",)
+
     def ufl_sub_spaces(self):
         raise NotImplementedError("Missing implementation of IFunctionSpace.ufl_sub_spaces in %s." % self.__class__.__name__)
 
 
 @attach_operators_from_hash_data
 class FunctionSpace(AbstractFunctionSpace):
+    __slots__ = ("_ufl_domain", "_ufl_element", "_ufl_value_shape",
+                 "_hash_data")
+
+    # Intern instances on the identity of (domain, element) (aka
+    # flyweight pattern, cf. MultiIndex._cache). A cached space keeps
+    # its domain and element alive, so the id pair cannot be reused by
+    # other live objects while the entry exists. Note that equality
+    # stays value-based: distinct but equal domain/element objects
+    # still yield spaces comparing equal through the hash data.
+    _cache = weakref.WeakValueDictionary()
+
+    def __getnewargs__(self):
+        return (self._ufl_domain, self._ufl_element)
+
+    def __new__(cls, domain, element):
+        if cls is not FunctionSpace:
+            # Don't intern instances of subclasses
+            return super().__new__(cls)
+        key = (id(domain), id(element))
+        self = FunctionSpace._cache.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            FunctionSpace._cache[key] = self
+        return self
+
     def __init__(self, domain, element):
+        if getattr(self, "_hash_data", None) is not None:
+            # Interned instance returned from __new__ has already
+            # been initialized
+            return
         if domain is None:
             # DOLFIN hack
             # TODO: Is anything expected from element.cell() in this case?
@@ -48,6 +81,28 @@ class FunctionSpace(AbstractFunctionSpace):
         self._ufl_domain = domain
         self._ufl_element = element
 
+        # Cache the element value shape; for mixed elements
+        # value_shape() walks all sub elements, and the same space is
+        # typically shared by many coefficients and arguments
+        if element is None:
+            self._ufl_value_shape = ()
+        else:
+            self._ufl_value_shape = element.value_shape()
+
+        # Precompute hash data once; __hash__ and __eq__ attached by
+        # attach_operators_from_hash_data call _ufl_hash_data_ for
+        # every comparison, so rebuilding this tuple each time is a
+        # measurable cost in form compilation.
+        if domain is None:
+            ddata = None
+        else:
+            ddata = domain._ufl_hash_data_()
+        if element is None:
+            edata = None
+        else:
+            edata = element._ufl_hash_data_()
+        self._hash_data = ("FunctionSpace", ddata, edata)
+
     def ufl_sub_spaces(self):
         "Return ufl sub spaces."
         return ()
@@ -60,6 +115,10 @@ class FunctionSpace(AbstractFunctionSpace):
         "Return ufl element."
         return self._ufl_element
 
+    def ufl_value_shape(self):
+        "Return the cached value shape of the element."
+        return self._ufl_value_shape
+
     def ufl_domains(self):
         "Return ufl domains."
         domain = self.ufl_domain()
@@ -69,17 +128,7 @@ class FunctionSpace(AbstractFunctionSpace):
             return (domain,)
 
     def _ufl_hash_data_(self):
-        domain = self.ufl_domain()
-        element = self.ufl_element()
-        if domain is None:
-            ddata = None
-        else:
-            ddata = domain._ufl_hash_data_()
-        if element is None:
-            edata = None
-        else:
-            edata = element._ufl_hash_data_()
-        return ("FunctionSpace", ddata, edata)
+        return self._hash_data
 
     def _ufl_signature_data_(self, renumbering):
         domain = self.ufl_domain()
@@ -101,18 +150,25 @@ class FunctionSpace(AbstractFunctionSpace):
 
 @attach_operators_from_hash_data
 class TensorProductFunctionSpace(AbstractFunctionSpace):
+    __slots__ = ("_ufl_function_spaces", "_hash_data")
+
     def __init__(self, *function_spaces):
         AbstractFunctionSpace.__init__(self)
         self._ufl_function_spaces = function_spaces
+        hash_data = ["TensorProductFunctionSpace"]
+        hash_data.extend(V._ufl_hash_data_() for V in function_spaces)
+        self._hash_data = tuple(hash_data)
 
     def ufl_sub_spaces(self):
         return self._ufl_function_spaces
 
     def _ufl_hash_data_(self):
-        return ("TensorProductFunctionSpace",) + tuple(V._ufl_hash_data_() for V in self.ufl_sub_spaces())
+        return self._hash_data
 
     def _ufl_signature_data_(self, renumbering):
-        return ("TensorProductFunctionSpace",) + tuple(V._ufl_signature_data_(renumbering) for V in self.ufl_sub_spaces())
+        sigdata = ["TensorProductFunctionSpace"]
+        sigdata.extend(V._ufl_signature_data_(renumbering) for V in self.ufl_sub_spaces())
+        return tuple(sigdata)
 
     def __repr__(self):
         r = "TensorProductFunctionSpace(*%s)" % repr(self._ufl_function_spaces)
@@ -121,15 +177,23 @@ class TensorProductFunctionSpace(AbstractFunctionSpace):
 
 @attach_operators_from_hash_data
 class MixedFunctionSpace(AbstractFunctionSpace):
+    __slots__ = ("_ufl_function_spaces", "_ufl_elements", "_ufl_domains",
+                 "_hash_data")
+
     def __init__(self, *args):
         AbstractFunctionSpace.__init__(self)
         self._ufl_function_spaces = args
-        self._ufl_elements = list()
-        for fs in args:
-            if isinstance(fs, FunctionSpace):
-                self._ufl_elements.append(fs.ufl_element())
-            else:
-                error("Expecting FunctionSpace objects")
+        if not all(isinstance(fs, FunctionSpace) for fs in args):
+            error("Expecting FunctionSpace objects")
+        self._ufl_elements = [fs.ufl_element() for fs in args]
+        hash_data = ["MixedFunctionSpace"]
+        hash_data.extend(V._ufl_hash_data_() for V in args)
+        self._hash_data = tuple(hash_data)
+        # Joined domains are computed lazily in ufl_domains(); they
+        # cannot change after construction, but join_domains raises
+        # for sub-spaces of differing geometric dimension and such
+        # mixed spaces are legal to construct.
+        self._ufl_domains = None
 
     def ufl_sub_spaces(self):
         "Return ufl sub spaces."
@@ -151,12 +215,17 @@ class MixedFunctionSpace(AbstractFunctionSpace):
             Consider building a FunctionSpace from a MixedElement
             in case of homogeneous dimension.""")
 
+    def ufl_value_shape(self):
+        "Return the value shape of the single element."
+        return self.ufl_element().value_shape()
+
     def ufl_domains(self):
         "Return ufl domains."
-        domainlist = []
-        for s in self._ufl_function_spaces:
-            domainlist.extend(s.ufl_domains())
-        return join_domains(domainlist)
+        if self._ufl_domains is None:
+            self._ufl_domains = join_domains(
+                [domain for fs in self._ufl_function_spaces
+                 for domain in fs.ufl_domains()])
+        return self._ufl_domains
 
     def ufl_domain(self):
         "Return ufl domain."
@@ -172,10 +241,12 @@ class MixedFunctionSpace(AbstractFunctionSpace):
         return len(self._ufl_function_spaces)
 
     def _ufl_hash_data_(self):
-        return ("MixedFunctionSpace",) + tuple(V._ufl_hash_data_() for V in self.ufl_sub_spaces())
+        return self._hash_data
 
     def _ufl_signature_data_(self, renumbering):
-        return ("MixedFunctionSpace",) + tuple(V._ufl_signature_data_(renumbering) for V in self.ufl_sub_spaces())
+        sigdata = ["MixedFunctionSpace"]
+        sigdata.extend(V._ufl_signature_data_(renumbering) for V in self.ufl_sub_spaces())
+        return tuple(sigdata)
 
     def __repr__(self):
         r = "MixedFunctionSpace(*%s)" % repr(self._ufl_function_spaces)
@@ -15,10 +15,10 @@ def id_or_none(obj):
     """
     if obj is None:
         return None
-    elif hasattr(obj, 'ufl_id'):
-        return obj.ufl_id()
-    else:
-        return id(obj)
+    ufl_id = getattr(obj, 'ufl_id', None)
+    if ufl_id is not None:
+        return ufl_id()
+    return id(obj)
 
 
 def metadata_equal(a, b):
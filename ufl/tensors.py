@@ -56,9 +56,11 @@ class ListTensor(Operator):
     def __init__(self, *expressions):
         Operator.__init__(self, expressions)
 
-        # Checks
-        indexset = set(self.ufl_operands[0].ufl_free_indices)
-        if not all(not (indexset ^ set(e.ufl_free_indices)) for e in self.ufl_operands):
+        # Checks; free index tuples are sorted and duplicate-free, so
+        # comparing them directly is equivalent to comparing sets and
+        # avoids building two sets per operand
+        fi = self.ufl_operands[0].ufl_free_indices
+        if not all(fi == e.ufl_free_indices for e in self.ufl_operands[1:]):
             error("Can't combine subtensor expressions with different sets of free indices.")
 
     @property
@@ -8,7 +8,8 @@ expressions as variables for differentiation."""
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
-from ufl.utils.counted import counted_init
+import itertools
+
 from ufl.log import error
 from ufl.core.expr import Expr
 from ufl.core.ufl_type import ufl_type
@@ -16,16 +17,29 @@ from ufl.core.terminal import Terminal
 from ufl.core.operator import Operator
 from ufl.constantvalue import as_ufl
 
+# Global counter for the count of new labels, cf. the coefficient
+# counter in coefficient.py
+_label_counter = itertools.count()
+
+
+def _next_count(count=None):
+    "Return count if given, otherwise draw from the global counter."
+    global _label_counter
+    if count is None:
+        return next(_label_counter)
+    # Keep automatically assigned counts ahead of any explicitly
+    # given count, like counted_init does with _globalcount
+    _label_counter = itertools.count(max(count + 1, next(_label_counter)))
+    return count
+
 
 @ufl_type()
 class Label(Terminal):
     __slots__ = ("_count",)
 
-    _globalcount = 0
-
     def __init__(self, count=None):
         Terminal.__init__(self)
-        counted_init(self, count, Label)
+        self._count = _next_count(count)
 
     def count(self):
         return self._count